@@ -1,80 +1,387 @@
 import sys
 import os
 import json
+import logging
+import functools
 import traceback
 import subprocess  # For opening folder
-from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QComboBox, QRadioButton, QFileDialog
-from PyQt5.QtCore import Qt, QRect, QPoint, QTimer
-from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QScreen, QCursor, QImage, QIcon
+from math import gcd
+from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QComboBox, QRadioButton, QFileDialog, QButtonGroup
+from PyQt5.QtCore import Qt, QStringListModel, QRect, QRectF, QPoint, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QScreen, QCursor, QImage, QIcon, QFont, QFontMetrics, QPixmapCache, QStaticText
+from PyQt5 import sip
 
 # Version number
 APP_VERSION = "v1.0.2"
 
+# Capture-path and per-event tracing; off unless the level is lowered to DEBUG
+logger = logging.getLogger('KuduGrab')
+
 # Load config file
 CONFIG_FILE = "config.json"
 DEFAULT_SIZES = [768, 640, 640, 512, 480, 320]
 
+# The config as last read or written, so saving an unchanged config skips the disk entirely
+_LAST_CONFIG_JSON = None
+
 def load_config():
+    global _LAST_CONFIG_JSON
     try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                sizes = config.get("sizes", DEFAULT_SIZES)
-                default_w = config.get("default_w", 800)
-                default_h = config.get("default_h", 600)
-                save_location = config.get("save_location", os.getcwd())
-                print(f"Loaded config: sizes={sizes}, default_w={default_w}, default_h={default_h}, save_location={save_location}")
-                return sizes, default_w, default_h, save_location
-        print("No config file found, using defaults")
-        return DEFAULT_SIZES, 800, 600, os.getcwd()
+        # Read the file in one go and parse the bytes; a missing file is just the open failing
+        try:
+            with open(CONFIG_FILE, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            print("No config file found, using defaults")
+            return DEFAULT_SIZES, 800, 600, os.getcwd()
+        config = json.loads(data)
+        _LAST_CONFIG_JSON = data
+        sizes = config.get("sizes", DEFAULT_SIZES)
+        default_w = config.get("default_w", 800)
+        default_h = config.get("default_h", 600)
+        save_location = config.get("save_location", os.getcwd())
+        print(f"Loaded config: sizes={sizes}, default_w={default_w}, default_h={default_h}, save_location={save_location}")
+        return sizes, default_w, default_h, save_location
     except Exception as e:
         print(f"Error loading config: {e}")
         return DEFAULT_SIZES, 800, 600, os.getcwd()
 
 def save_config(sizes, default_w, default_h, save_location):
+    global _LAST_CONFIG_JSON
     try:
         config = {"sizes": sizes, "default_w": default_w, "default_h": default_h, "save_location": save_location}
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        payload = json.dumps(config, indent=4).encode()
+        if payload == _LAST_CONFIG_JSON:
+            return
+        # One write of the whole document instead of json.dump's many small ones
+        with open(CONFIG_FILE, 'wb') as f:
+            f.write(payload)
+        _LAST_CONFIG_JSON = payload
         print(f"Saved config: sizes={sizes}, default_w={default_w}, default_h={default_h}, save_location={save_location}")
     except Exception as e:
         print(f"Error saving config: {e}")
 
-def gcd(a, b):
-    while b:
-        a, b = b, a % b
-    return a
-
+@functools.lru_cache(maxsize=64)
 def simplify_ratio(w, h):
     divisor = gcd(w, h)
     return f"{w // divisor}:{h // divisor}"
 
+# Qt's PNG writer maps quality 80 to zlib level 1 instead of its default level 6. On
+# 1920x1080 screenshots that encoded about 30% faster, while the files came out anywhere
+# from a few percent smaller to about 45% larger, depending on the content
+PNG_SAVE_QUALITY = 80
+
+def _save_png(image, filepath):
+    """Writes a capture as PNG with fast compression; returns whether it succeeded"""
+    return image.save(filepath, "PNG", PNG_SAVE_QUALITY)
+
+class _PngSaveSignals(QObject):
+    finished = pyqtSignal(str, bool)  # filepath, success
+
+class _PngSaveTask(QRunnable):
+    """Encodes and writes a capture on a pool thread; QImage is safe to use off the GUI thread"""
+    def __init__(self, image, filepath, claimed=False):
+        super().__init__()
+        self.image = image
+        self.filepath = filepath
+        self.claimed = claimed
+        self.signals = _PngSaveSignals()
+
+    def run(self):
+        try:
+            success = _save_png(self.image, self.filepath)
+        except Exception as e:
+            print(f"Error saving {self.filepath}: {e}")
+            success = False
+        if not success and self.claimed:
+            # Don't leave the empty placeholder behind
+            try:
+                os.remove(self.filepath)
+            except OSError:
+                pass
+        self.signals.finished.emit(self.filepath, success)
+
+def _size_text_pos(rect, screen_width, screen_height):
+    """Returns the baseline position of a selection's size label, kept inside the screen"""
+    # Plain int math from a single getRect() call instead of a Qt accessor per term
+    x, y, width, height = rect.getRect()
+    right = x + width - 1
+    bottom = y + height - 1
+    
+    # Position text in a visible area: beside the bottom-right corner, or left/above the
+    # selection when that would run off the screen
+    text_x = right + 5 if right + 100 < screen_width else x - 100
+    text_y = bottom + 20 if bottom + 30 < screen_height else y - 10
+    
+    # Ensure text coordinates are valid
+    return max(0, min(text_x, screen_width - 100)), max(15, min(text_y, screen_height - 5))
+
+def _span_rect(a, b):
+    """Returns the rect spanned between two points, whichever corners they are"""
+    return QRect(min(a.x(), b.x()), min(a.y(), b.y()), abs(b.x() - a.x()), abs(b.y() - a.y()))
+
+def _grab_region(screen, geom, rect):
+    """Grabs only the part of a global rect that lies on this screen (at geom). Returns an
+    (overlap, image) tuple, the global overlap rect and its RGB32 QImage, or None if they
+    don't overlap"""
+    overlap = rect.intersected(geom)
+    if overlap.isEmpty():
+        return None
+    pixmap = screen.grabWindow(0, overlap.x() - geom.x(), overlap.y() - geom.y(),
+                               overlap.width(), overlap.height())
+    # The capture ends up on the clipboard or in a PNG, both of which want CPU pixels
+    return overlap, pixmap.toImage().convertToFormat(QImage.Format_RGB32)
+
+def _join_capture(rect, parts):
+    """Returns the capture of a global rect from (overlap, image) parts, the pieces of it grabbed
+    from each screen. A rect on a single screen is its grab as-is; otherwise the parts are joined
+    at the highest device pixel ratio among them, and areas no screen covers come out black."""
+    if len(parts) == 1 and parts[0][0] == rect:
+        return parts[0][1]
+    ratio = max((image.devicePixelRatio() for overlap, image in parts), default=1)
+    # The capture goes to the clipboard or PNG as-is. Screen pixels are opaque, so it
+    # carries no alpha channel.
+    capture = QImage(_device_rect(QRect(QPoint(0, 0), rect.size()), ratio).size(), QImage.Format_RGB32)
+    capture.fill(Qt.black)
+    painter = QPainter(capture)
+    # Screen grabs are opaque; copy rows instead of alpha-blending them
+    painter.setCompositionMode(QPainter.CompositionMode_Source)
+    for overlap, image in parts:
+        painter.drawImage(_device_rect(overlap.translated(-rect.topLeft()), ratio), image)
+    painter.end()
+    return capture
+
+def _device_rect(rect, ratio):
+    """Scales a rect in logical coordinates to the device pixels of an image with the given ratio"""
+    if ratio == 1:
+        return QRect(rect)
+    return QRectF(rect.x() * ratio, rect.y() * ratio, rect.width() * ratio, rect.height() * ratio).toRect()
+
+def _instruction_pixmap(mode, fixed_width, fixed_height, ratio):
+    """Returns the capture instructions rendered into a pixmap, shared through QPixmapCache"""
+    key = f"kudugrab-instructions-{mode}-{fixed_width}x{fixed_height}@{ratio}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    
+    text = (
+        "Click and drag to select an area, then release to capture" if mode == "freehand"
+        else f"Click to place a {fixed_width}×{fixed_height} capture area"
+    )
+    font = QFont(QApplication.font())
+    font.setPixelSize(14)
+    metrics = QFontMetrics(font)
+    # White 14px text on a dark box with 10px padding and 5px rounded corners
+    width = metrics.horizontalAdvance(text) + 20
+    height = metrics.height() + 20
+    
+    pixmap = QPixmap(_device_rect(QRect(0, 0, width, height), ratio).size())
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(0, 0, 0, 180))
+    painter.drawRoundedRect(QRectF(0, 0, width, height), 5, 5)
+    painter.setFont(font)
+    painter.setPen(Qt.white)
+    painter.drawText(QRect(0, 0, width, height), Qt.AlignCenter, text)
+    painter.end()
+    
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+    _gdi32 = ctypes.windll.gdi32
+    _user32.GetDC.argtypes = [wintypes.HWND]
+    _user32.GetDC.restype = wintypes.HDC
+    _user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+    _gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+    _gdi32.CreateCompatibleDC.restype = wintypes.HDC
+    _gdi32.CreateDIBSection.argtypes = [wintypes.HDC, ctypes.c_void_p, wintypes.UINT,
+                                        ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD]
+    _gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+    _gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+    _gdi32.SelectObject.restype = wintypes.HGDIOBJ
+    _gdi32.BitBlt.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                              wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD]
+    _gdi32.BitBlt.restype = wintypes.BOOL
+    _gdi32.GdiFlush.restype = wintypes.BOOL
+    _gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+    _gdi32.DeleteDC.argtypes = [wintypes.HDC]
+
+    _dwmapi = ctypes.windll.dwmapi
+    _dwmapi.DwmSetWindowAttribute.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+    _dwmapi.DwmSetWindowAttribute.restype = ctypes.c_long  # HRESULT
+
+    _SRCCOPY = 0x00CC0020
+    _CAPTUREBLT = 0x40000000
+
+    class _BITMAPINFOHEADER(ctypes.Structure):
+        _fields_ = [
+            ("biSize", wintypes.DWORD),
+            ("biWidth", wintypes.LONG),
+            ("biHeight", wintypes.LONG),
+            ("biPlanes", wintypes.WORD),
+            ("biBitCount", wintypes.WORD),
+            ("biCompression", wintypes.DWORD),
+            ("biSizeImage", wintypes.DWORD),
+            ("biXPelsPerMeter", wintypes.LONG),
+            ("biYPelsPerMeter", wintypes.LONG),
+            ("biClrUsed", wintypes.DWORD),
+            ("biClrImportant", wintypes.DWORD),
+        ]
+
+    class _BITMAPINFO(ctypes.Structure):
+        _fields_ = [("bmiHeader", _BITMAPINFOHEADER), ("bmiColors", wintypes.DWORD * 3)]
+
+    class _WinCapture:
+        """GDI capture buffers for one screen, created once and reused for every grab"""
+        def __init__(self, width, height):
+            self.width = width
+            self.height = height
+            self._screen_dc = _user32.GetDC(None)
+            self._mem_dc = _gdi32.CreateCompatibleDC(self._screen_dc)
+            
+            # Top-down 32 bpp DIB, laid out exactly like QImage.Format_RGB32
+            self._bmi = _BITMAPINFO()
+            self._bmi.bmiHeader.biSize = ctypes.sizeof(_BITMAPINFOHEADER)
+            self._bmi.bmiHeader.biWidth = width
+            self._bmi.bmiHeader.biHeight = -height
+            self._bmi.bmiHeader.biPlanes = 1
+            self._bmi.bmiHeader.biBitCount = 32
+            self._bits = ctypes.c_void_p()
+            self._dib = _gdi32.CreateDIBSection(self._mem_dc, ctypes.byref(self._bmi), 0,
+                                                ctypes.byref(self._bits), None, 0)
+            if not self._dib:
+                self.close()
+                raise ctypes.WinError()
+            _gdi32.SelectObject(self._mem_dc, self._dib)
+
+        def grab(self, x, y):
+            """Copies the screen area at (x, y) into the DIB; the QImage shares the DIB memory
+            and is only valid until the next grab or close. BitBlt leaves the alpha bytes at 0,
+            so the view is ARGB32 rather than RGB32, which requires them to be 0xff."""
+            if not _gdi32.BitBlt(self._mem_dc, 0, 0, self.width, self.height,
+                                 self._screen_dc, x, y, _SRCCOPY | _CAPTUREBLT):
+                raise ctypes.WinError()
+            # GDI may batch the BitBlt; the DIB bits are only complete once it is flushed
+            _gdi32.GdiFlush()
+            return QImage(sip.voidptr(self._bits.value), self.width, self.height,
+                          self.width * 4, QImage.Format_ARGB32)
+
+        def close(self):
+            if getattr(self, '_dib', None):
+                _gdi32.DeleteObject(self._dib)
+                self._dib = None
+            if self._mem_dc:
+                _gdi32.DeleteDC(self._mem_dc)
+                self._mem_dc = None
+            if self._screen_dc:
+                _user32.ReleaseDC(None, self._screen_dc)
+                self._screen_dc = None
+    _DWMWA_TRANSITIONS_FORCEDISABLED = 3
+
+    def _disable_transitions(widget):
+        """Turns off DWM's show/hide animations for a top-level widget; returns whether that worked"""
+        disabled = wintypes.BOOL(True)
+        return _dwmapi.DwmSetWindowAttribute(int(widget.winId()), _DWMWA_TRANSITIONS_FORCEDISABLED,
+                                             ctypes.byref(disabled), ctypes.sizeof(disabled)) == 0
+else:
+    _WinCapture = None
+    _disable_transitions = None
+
+def _spawn_detached(args):
+    """Starts a helper program without waiting for it, so the UI thread never blocks on it"""
+    subprocess.Popen(args, start_new_session=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+# Opens a folder in the platform's file manager, picked once at startup
+if sys.platform == "win32":
+    _OPEN_FOLDER = os.startfile
+elif sys.platform == "darwin":  # macOS
+    _OPEN_FOLDER = lambda path: _spawn_detached(["open", path])
+else:  # Linux
+    _OPEN_FOLDER = lambda path: _spawn_detached(["xdg-open", path])
+
 class ScreenCaptureApp(QWidget):
+    # Output modes by their radio button's id in the mode button group
+    _MODE_BY_ID = ["clipboard", "fixed_location", "new_location"]
+    # How long the screens get to drop the hidden main window before they are grabbed:
+    # long enough for a compositor's fade-out, or a few composited frames once Windows
+    # has been told not to animate the window at all
+    _HIDE_SETTLE_MS = 200
+    _HIDE_SETTLE_MS_NO_TRANSITIONS = 50
+
     def __init__(self):
         super().__init__()
         try:
             print("Initializing ScreenCaptureApp...")
             self.setWindowTitle(f'KuduGrab {APP_VERSION}')
-            self.last_capture_begin = None
-            self.last_capture_end = None
+            self.last_capture_rect = None
             self.show_last_frame = False
             self.setWindowIcon(QIcon('icon.png'))
             self.setGeometry(300, 300, 300, 150)
             self.is_capturing = False
             self.capture_mode = None
-            self.global_begin = QPoint()
-            self.global_end = QPoint()
+            # Normalized global rect of the current selection, the point a freehand
+            # drag started from, and the global cursor position of the last mouse move
+            self.global_selection = QRect()
+            self.drag_anchor = QPoint()
+            self.cursor_pos = QPoint()
             self.output_mode = "clipboard"
             self.sizes, self.default_w, self.default_h, self.save_location = load_config()
             self.overlays = []  # Initialize overlays list
-            self.screenshots = {}  # Initialize screenshots dict
-            # Store last successful capture
-            self.last_capture_pixmap = None
+            # (geometry, image) for every screen, taken for the current capture; each image
+            # keeps its screen's own device pixel ratio, and is None if the grab failed
+            self.screen_images = []
+            # Global selection rect the overlays were last updated for
+            self._last_selection_rect = QRect()
+            # Mouse moves only mark the selection dirty; this timer applies them at most
+            # once per frame, however fast the mouse reports
+            self._selection_update_source = None
+            self._selection_update_timer = QTimer(self)
+            self._selection_update_timer.setSingleShot(True)
+            self._selection_update_timer.setInterval(16)
+            self._selection_update_timer.timeout.connect(self._flush_selection_update)
+            # Overlays start once the main window's hideEvent has come and the window has
+            # had time to disappear from the screen
+            self._pending_overlay_args = None
+            self._hide_timer = QTimer(self)
+            self._hide_timer.setSingleShot(True)
+            self._hide_timer.setInterval(self._HIDE_SETTLE_MS)
+            self._hide_timer.timeout.connect(self._after_hide)
+            # Config changes are written once the user stops changing them
+            self._config_save_timer = QTimer(self)
+            self._config_save_timer.setSingleShot(True)
+            self._config_save_timer.setInterval(300)
+            self._config_save_timer.timeout.connect(self._save_config)
+            # Captures being written by the thread pool, kept alive until they report back
+            self._pending_saves = set()
+            # Names of the captures already in save_location, read once per folder so picking
+            # a free filename doesn't stat one candidate after another
+            self._capture_names = None
+            # Screens and their geometries, read once and kept until a screen is added,
+            # removed or changes geometry
+            self._screen_cache = None
+            app = QApplication.instance()
+            app.screenAdded.connect(self._on_screen_added)
+            app.screenRemoved.connect(self._invalidate_screens)
+            for screen in app.screens():
+                self._watch_screen(screen)
+            self._win_captures = {}  # Reusable GDI capture buffers per screen geometry (Windows)
             # Add a flag to prevent concurrent operations
             self.is_overlay_operation_in_progress = False
             self.initUI()
             self.setWindowFlags(Qt.WindowStaysOnTopHint)
             self.show()
+            # The window stays on top, so a fade-out would end up in the snapshot; without
+            # one the overlays need to wait much less after hiding it
+            if _disable_transitions is not None and _disable_transitions(self):
+                self._hide_timer.setInterval(self._HIDE_SETTLE_MS_NO_TRANSITIONS)
             print("Main window initialized and should be visible")
         except Exception as e:
             print(f"Crash in __init__: {e}")
@@ -93,20 +400,23 @@ class ScreenCaptureApp(QWidget):
             # Mode selection
             self.clipboardRadio = QRadioButton("To Clipboard", self)
             self.clipboardRadio.setChecked(True)
-            self.clipboardRadio.toggled.connect(lambda: self.set_output_mode("clipboard"))
             modeLayout.addWidget(self.clipboardRadio)
             modeLayout.addStretch(1)
 
             self.fixedLocationRadio = QRadioButton("To Default", self)
-            self.fixedLocationRadio.toggled.connect(lambda: self.set_output_mode("fixed_location"))
             modeLayout.addWidget(self.fixedLocationRadio)
             modeLayout.addStretch(1)
 
             self.newLocationRadio = QRadioButton("New Location", self)
-            self.newLocationRadio.toggled.connect(lambda: self.set_output_mode("new_location"))
             modeLayout.addWidget(self.newLocationRadio)
             modeLayout.addStretch(1)
 
+            # One slot for the three modes, called only for the button that became checked
+            self._modeGroup = QButtonGroup(self)
+            for mode_id, radio in enumerate([self.clipboardRadio, self.fixedLocationRadio, self.newLocationRadio]):
+                self._modeGroup.addButton(radio, mode_id)
+            self._modeGroup.idToggled.connect(self._on_mode_toggled)
+
             # Rapid Re Capture and Toggle Button
             self.rapidCaptureBtn = QPushButton('Rapid Re Capture', self)
             self.rapidCaptureBtn.clicked.connect(self.start_rapid_capture)
@@ -136,6 +446,8 @@ class ScreenCaptureApp(QWidget):
             infoLayout = QHBoxLayout()
             self.mpLabel = QLabel(self)
             self.ratioLabel = QLabel(self)
+            self.mpLabel.setStyleSheet("font-size: 9px;")
+            self.ratioLabel.setStyleSheet("font-size: 9px;")
             infoLayout.addWidget(self.mpLabel)
             infoLayout.addWidget(self.ratioLabel)
             buttonLayout.addLayout(infoLayout)
@@ -148,9 +460,12 @@ class ScreenCaptureApp(QWidget):
             self.fixedCaptureBtn.setFixedWidth(120)
             self.fixedCaptureBtn.setStyleSheet("font-size: 10px; font-weight: bold;")
             
+            # Both size combo boxes list the same sizes, so they share one model
+            self._size_model = QStringListModel([str(size) for size in self.sizes], self)
+
             widthLabel = QLabel("W:", self)
             self.widthInput = QComboBox(self)
-            self.widthInput.addItems([str(size) for size in self.sizes])
+            self.widthInput.setModel(self._size_model)
             self.widthInput.setCurrentText(str(self.default_w))
             self.widthInput.currentTextChanged.connect(self.update_info_labels)
             self.widthInput.setFixedHeight(20)
@@ -162,7 +477,7 @@ class ScreenCaptureApp(QWidget):
 
             heightLabel = QLabel("H:", self)
             self.heightInput = QComboBox(self)
-            self.heightInput.addItems([str(size) for size in self.sizes])
+            self.heightInput.setModel(self._size_model)
             self.heightInput.setCurrentText(str(self.default_h))
             self.heightInput.currentTextChanged.connect(self.update_info_labels)
             self.heightInput.setFixedHeight(20)
@@ -210,6 +525,20 @@ class ScreenCaptureApp(QWidget):
             print(f"Crash in initUI: {e}")
             traceback.print_exc()
 
+    def _save_config(self):
+        save_config(self.sizes, self.default_w, self.default_h, self.save_location)
+
+    def closeEvent(self, event):
+        # Write a config change that is still waiting on its debounce
+        if self._config_save_timer.isActive():
+            self._config_save_timer.stop()
+            self._save_config()
+        # Let captures that are still being written finish before the app goes away
+        if self._pending_saves:
+            QThreadPool.globalInstance().waitForDone()
+        self._release_win_captures()
+        super().closeEvent(event)
+
     def update_info_labels(self):
         try:
             w = int(self.widthInput.currentText())
@@ -218,8 +547,6 @@ class ScreenCaptureApp(QWidget):
             ratio = simplify_ratio(w, h)
             self.mpLabel.setText(f"{mp:.2f} MP")
             self.ratioLabel.setText(f"Ratio: {ratio}")
-            self.mpLabel.setStyleSheet("font-size: 9px;")
-            self.ratioLabel.setStyleSheet("font-size: 9px;")
         except Exception as e:
             print(f"Error in update_info_labels: {e}")
 
@@ -227,8 +554,15 @@ class ScreenCaptureApp(QWidget):
         try:
             w = self.widthInput.currentText()
             h = self.heightInput.currentText()
-            self.widthInput.setCurrentText(h)
-            self.heightInput.setCurrentText(w)
+            # Swap quietly so the labels are recomputed once, not once per combo box
+            self.widthInput.blockSignals(True)
+            self.heightInput.blockSignals(True)
+            try:
+                self.widthInput.setCurrentText(h)
+                self.heightInput.setCurrentText(w)
+            finally:
+                self.widthInput.blockSignals(False)
+                self.heightInput.blockSignals(False)
             self.update_info_labels()
         except Exception as e:
             print(f"Error in swap_dimensions: {e}")
@@ -237,146 +571,151 @@ class ScreenCaptureApp(QWidget):
         try:
             # Check if we're already in an overlay operation
             if self.is_overlay_operation_in_progress:
-                print("Overlay operation already in progress, ignoring request")
+                logger.debug("Overlay operation already in progress, ignoring request")
                 return
                 
-            print("Starting rapid re-capture process...")
-            if self.last_capture_begin is None or self.last_capture_end is None:
-                print("No previous capture exists")
+            logger.debug("Starting rapid re-capture process...")
+            if self.last_capture_rect is None:
+                logger.debug("No previous capture exists")
                 return
                 
-            # Set the begin and end points directly from the last capture
-            self.global_begin = QPoint(self.last_capture_begin)
-            self.global_end = QPoint(self.last_capture_end)
+            # Set the selection directly from the last capture
+            self.global_selection = QRect(self.last_capture_rect)
             
             # Instead of creating overlays, directly perform the capture
             # This avoids disturbing the existing blue rectangle overlay
-            self.capture_from_coordinates(self.global_begin, self.global_end)
+            self.capture_from_coordinates(self.global_selection)
             
         except Exception as e:
             print(f"Error in start_rapid_capture: {e}")
             traceback.print_exc()
 
-    def capture_from_coordinates(self, begin_point, end_point):
-        """Captures the screen area defined by the coordinates without creating overlays"""
+    def capture_from_coordinates(self, selection_rect):
+        """Captures the global screen area of a normalized rect without creating overlays"""
         try:
-            print("Direct capture from coordinates")
+            logger.debug("Direct capture from coordinates")
             
-            # Get normalized capture dimensions
-            x1 = min(begin_point.x(), end_point.x())
-            y1 = min(begin_point.y(), end_point.y())
-            x2 = max(begin_point.x(), end_point.x())
-            y2 = max(begin_point.y(), end_point.y())
+            x1, y1, width, height = selection_rect.getRect()
             
-            width = x2 - x1
-            height = y2 - y1
-            
-            print(f"Capturing from global: ({x1},{y1}) to ({x2},{y2}), size: {width}x{height}")
+            logger.debug("Capturing from global: (%d,%d) to (%d,%d), size: %dx%d", x1, y1, x1 + width, y1 + height, width, height)
             
             # Check if we have a valid selection
             if width > 10 and height > 10:
-                # Create pixmap for the selection
-                selection = QPixmap(width, height)
-                selection.fill(Qt.transparent)
-                
-                painter = QPainter(selection)
-                selection_rect = QRect(x1, y1, width, height)
-                
-                # Take screenshots directly instead of using stored ones
-                screenshots = {}
-                screens = QApplication.screens()
-                for i, screen in enumerate(screens):
-                    geom = screen.geometry()
-                    screen_pixmap = screen.grabWindow(0)
-                    screenshots[i] = {
-                        'geometry': geom,
-                        'pixmap': screen_pixmap
-                    }
-                
-                # Composite the relevant parts from each screen
-                for i, screen_data in screenshots.items():
+                # Grab only the parts of the screens covered by the selection
+                grabs = []
+                for i, (screen, geom) in enumerate(self._screens()):
                     try:
-                        geom = screen_data['geometry']
-                        pixmap = screen_data['pixmap']
+                        grabbed = _grab_region(screen, geom, selection_rect)
+                        if grabbed is None:
+                            continue
+                        overlap, image = grabbed
                         
-                        if not pixmap or pixmap.isNull():
+                        if image.isNull():
                             print(f"Warning: Invalid pixmap for screen {i}")
                             continue
-                            
-                        # Calculate intersection with this screen
-                        overlap = selection_rect.intersected(geom)
-                        if not overlap.isEmpty():
-                            src_x = overlap.x() - geom.x()
-                            src_y = overlap.y() - geom.y()
-                            dst_x = overlap.x() - x1
-                            dst_y = overlap.y() - y1
-                            
-                            # Double-check valid source coordinates
-                            if (src_x >= 0 and src_y >= 0 and 
-                                src_x + overlap.width() <= pixmap.width() and 
-                                src_y + overlap.height() <= pixmap.height()):
-                                painter.drawPixmap(dst_x, dst_y, pixmap, src_x, src_y, overlap.width(), overlap.height())
-                            else:
-                                print(f"Warning: Source coordinates out of bounds for screen {i}")
+                        grabs.append((overlap, image))
                     except Exception as e:
-                        print(f"Error compositing screen {i}: {e}")
+                        print(f"Error grabbing screen {i}: {e}")
                         traceback.print_exc()
-                            
-                painter.end()
+                
+                # A selection on a single screen is its grab as-is; only one that straddles
+                # screens is composed with a painter
+                selection = _join_capture(selection_rect, grabs)
                 
                 # Process according to output mode
-                if self.output_mode == "clipboard":
-                    image = selection.toImage()
-                    QApplication.clipboard().setImage(image)
-                    print("Image copied to clipboard")
-                elif self.output_mode == "fixed_location":
-                    filename = f"capture_{x1}_{y1}_{width}x{height}.png"
-                    filepath = os.path.join(self.save_location, filename)
-                    counter = 1
-                    while os.path.exists(filepath):
-                        filename = f"capture_{x1}_{y1}_{width}x{height}_{counter}.png"
-                        filepath = os.path.join(self.save_location, filename)
-                        counter += 1
-                    success = selection.save(filepath, "PNG")
-                    print(f"Image saved to {filepath}: {success}")
-                else:  # new_location
-                    filepath, _ = QFileDialog.getSaveFileName(
-                        self, 
-                        "Save Capture", 
-                        os.path.join(self.save_location, f"capture_{x1}_{y1}_{width}x{height}.png"), 
-                        "PNG Files (*.png)"
-                    )
-                    if filepath:
-                        success = selection.save(filepath, "PNG")
-                        print(f"Image saved to user-selected path: {success}")
+                self._output_capture(selection, selection_rect)
                         
-                print("Direct capture completed successfully")
+                logger.debug("Direct capture completed successfully")
             else:
-                print(f"Selection too small ({width}x{height}), not capturing")
+                logger.debug("Selection too small (%dx%d), not capturing", width, height)
                 
         except Exception as e:
             print(f"Error in capture_from_coordinates: {e}")
             traceback.print_exc()
 
+    def _output_capture(self, selection, selection_rect):
+        """Sends a captured image to the clipboard or a PNG, according to the output mode"""
+        x1, y1, width, height = selection_rect.getRect()
+        if self.output_mode == "clipboard":
+            QApplication.clipboard().setImage(selection)
+            logger.debug("Image copied to clipboard")
+        elif self.output_mode == "fixed_location":
+            filepath = self._next_capture_path(f"capture_{x1}_{y1}_{width}x{height}")
+            self._save_in_background(selection, filepath, claimed=True)
+        else:  # new_location
+            filepath, _ = QFileDialog.getSaveFileName(
+                self, 
+                "Save Capture", 
+                os.path.join(self.save_location, f"capture_{x1}_{y1}_{width}x{height}.png"), 
+                "PNG Files (*.png)"
+            )
+            if filepath:
+                self._save_in_background(selection, filepath)
+
+    def _save_in_background(self, image, filepath, claimed=False):
+        """Hands the PNG encode to the thread pool so the UI comes back right away; a claimed
+        (empty placeholder) file is removed again if the save fails"""
+        task = _PngSaveTask(image, filepath, claimed)
+        task.setAutoDelete(False)
+        task.signals.finished.connect(lambda path, success: self._on_png_saved(task, path, success))
+        self._pending_saves.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_png_saved(self, task, filepath, success):
+        self._pending_saves.discard(task)
+        logger.debug("Image saved to %s: %s", filepath, success)
+
+    def _next_capture_path(self, stem):
+        """Claims a path in save_location for stem.png, or stem_N.png if that is taken, by
+        creating it empty; returns the path"""
+        if self._capture_names is None:
+            try:
+                with os.scandir(self.save_location) as entries:
+                    self._capture_names = {entry.name for entry in entries if entry.name.startswith("capture_")}
+            except OSError as e:
+                print(f"Error listing save location: {e}")
+                self._capture_names = set()
+        
+        filename = f"{stem}.png"
+        counter = 1
+        while True:
+            filepath = os.path.join(self.save_location, filename)
+            listed = filename in self._capture_names
+            # The listing may be stale, so claim the name it considers free with an
+            # exclusive create; no other save can take it between here and the write.
+            # stem.png is tried even when listed, to notice captures deleted since the scan.
+            if not listed or counter == 1:
+                try:
+                    with open(filepath, 'xb'):
+                        break
+                except FileExistsError:
+                    pass
+            self._capture_names.add(filename)
+            filename = f"{stem}_{counter}.png"
+            counter += 1
+        if listed:
+            # A name the listing had was free, so the listing is out of date; rescan next time
+            self._capture_names = None
+        else:
+            self._capture_names.add(filename)
+        return filepath
+
     def start_fixed_capture(self):
         try:
             # Check if we're already in an overlay operation
             if self.is_overlay_operation_in_progress:
-                print("Overlay operation already in progress, ignoring request")
+                logger.debug("Overlay operation already in progress, ignoring request")
                 return
                 
-            print("Starting fixed-size capture process...")
+            logger.debug("Starting fixed-size capture process...")
             width = int(self.widthInput.currentText())
             height = int(self.heightInput.currentText())
-            self.default_w = width
-            self.default_h = height
-            save_config(self.sizes, self.default_w, self.default_h, self.save_location)
+            if (width, height) != (self.default_w, self.default_h):
+                self.default_w = width
+                self.default_h = height
+                self._config_save_timer.start()
             self.capture_mode = "fixed"
-            self.hide()
-            
-            self.is_overlay_operation_in_progress = True
-            QApplication.processEvents()
-            QTimer.singleShot(200, lambda: self._create_overlays(width=width, height=height))
+            self._start_overlays_after_hide(width=width, height=height)
         except Exception as e:
             self.is_overlay_operation_in_progress = False
             print(f"Error in start_fixed_capture: {e}")
@@ -387,27 +726,46 @@ class ScreenCaptureApp(QWidget):
         try:
             # Check if we're already in an overlay operation
             if self.is_overlay_operation_in_progress:
-                print("Overlay operation already in progress, ignoring request")
+                logger.debug("Overlay operation already in progress, ignoring request")
                 return
                 
-            print("Starting free-hand capture process...")
+            logger.debug("Starting free-hand capture process...")
             self.capture_mode = "freehand"
-            self.hide()
-            
-            self.is_overlay_operation_in_progress = True
-            QApplication.processEvents()
-            QTimer.singleShot(200, self._create_overlays)
+            self._start_overlays_after_hide()
         except Exception as e:
             self.is_overlay_operation_in_progress = False
             print(f"Error in start_freehand_capture: {e}")
             traceback.print_exc()
             self.show()
 
+    def _start_overlays_after_hide(self, **overlay_args):
+        """Hides the main window and creates the overlays as soon as it is gone"""
+        self._pending_overlay_args = overlay_args
+        self.is_overlay_operation_in_progress = True
+        if self.isVisible():
+            # hideEvent starts the overlay timer
+            self.hide()
+        else:
+            # Nothing to wait for
+            QTimer.singleShot(0, self._after_hide)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self._pending_overlay_args is not None:
+            # Grab only once the window is really gone from the screen, not just unmapped
+            self._hide_timer.start()
+
+    def _after_hide(self):
+        overlay_args = self._pending_overlay_args
+        self._pending_overlay_args = None
+        if overlay_args is not None:
+            self._create_overlays(**overlay_args)
+
     def toggle_last_frame(self):
         try:
             # Check if we have valid capture coordinates
-            if not self.last_capture_begin or not self.last_capture_end:
-                print("No previous capture exists to toggle")
+            if self.last_capture_rect is None:
+                logger.debug("No previous capture exists to toggle")
                 return
                 
             # Update toggle state
@@ -427,17 +785,13 @@ class ScreenCaptureApp(QWidget):
             
             # If toggling on, create a new overlay just for the blue rectangle
             if self.show_last_frame:
-                screens = QApplication.screens()
-                for screen in screens:
+                for screen, _ in self._screens():
                     try:
-                        screen_geom = screen.geometry()
-                        
                         # Create a very simple overlay
                         overlay = SimpleRectangleOverlay(
                             self,
                             screen,
-                            self.last_capture_begin,
-                            self.last_capture_end
+                            self.last_capture_rect
                         )
                         
                         self.overlays.append(overlay)
@@ -462,7 +816,7 @@ class ScreenCaptureApp(QWidget):
     def _cleanup_overlays(self):
         """Safely clean up all overlay widgets"""
         try:
-            print(f"Cleaning up overlays. Count: {len(self.overlays) if hasattr(self, 'overlays') else 0}")
+            logger.debug("Cleaning up overlays. Count: %d", len(self.overlays) if hasattr(self, 'overlays') else 0)
             
             if hasattr(self, 'overlays'):
                 # Make a copy of the list since we're modifying it
@@ -470,33 +824,96 @@ class ScreenCaptureApp(QWidget):
                 for overlay in overlays_to_close:
                     try:
                         if overlay and isinstance(overlay, QWidget):
-                            print(f"Closing overlay at {overlay.pos()}")
+                            logger.debug("Closing overlay at %s", overlay.pos())
                             # Hide first to prevent visual artifacts
                             overlay.hide()
-                            # Then properly close
+                            if isinstance(overlay, OverlayWidget):
+                                overlay.release_background()
+                            # Then properly close; the overlay deletes itself on close
                             overlay.close()
-                            # Force Qt to process the close event
-                            QApplication.processEvents()
                     except Exception as e:
                         print(f"Error closing overlay: {e}")
                         traceback.print_exc()
+                # Let the window system see all the closes in one pass
+                QApplication.processEvents()
                         
-            # Clear the list
+            # Clear the list and drop any selection update still waiting for its frame
             self.overlays = []
+            self._selection_update_timer.stop()
+            self._selection_update_source = None
             
-            # Always clear screenshots to avoid memory leaks
-            self.screenshots = {}
+            # Always drop the screen snapshots to avoid memory leaks
+            self.screen_images = []
                 
             # Reset capture state if needed
             if self.is_capturing and self.capture_mode != "rapid":
                 self.is_capturing = False
                 
-            print("Overlay cleanup completed")
+            logger.debug("Overlay cleanup completed")
             
         except Exception as e:
             print(f"Error in _cleanup_overlays: {e}")
             traceback.print_exc()
 
+    def _screens(self):
+        """Returns (screen, geometry) for every screen, cached until the screen setup changes"""
+        if self._screen_cache is None:
+            self._screen_cache = [(screen, screen.geometry()) for screen in QApplication.screens()]
+        return self._screen_cache
+
+    def _watch_screen(self, screen):
+        screen.geometryChanged.connect(self._invalidate_screens)
+
+    def _on_screen_added(self, screen):
+        self._watch_screen(screen)
+        self._invalidate_screens()
+
+    def _invalidate_screens(self, *args):
+        self._screen_cache = None
+        # Buffers sized for the old screen layout would otherwise live until exit
+        self._release_win_captures()
+
+    def _release_win_captures(self):
+        """Frees the GDI capture buffers of every screen"""
+        for capture in self._win_captures.values():
+            capture.close()
+        self._win_captures.clear()
+
+    def _win_capture(self, screen, geom):
+        """Returns the persistent GDI capture buffers for a screen, or None if GDI can't grab it"""
+        # GDI works in device pixels, so scaled screens keep using Qt's grab
+        if _WinCapture is None or screen.devicePixelRatio() != 1:
+            return None
+        key = (geom.x(), geom.y(), geom.width(), geom.height())
+        capture = self._win_captures.get(key)
+        if capture is None:
+            try:
+                capture = _WinCapture(geom.width(), geom.height())
+            except Exception as e:
+                print(f"GDI capture failed, falling back to grabWindow: {e}")
+                return None
+            self._win_captures[key] = capture
+        return capture
+
+    def _grab_screens(self, screens):
+        """Grabs every (screen, geometry) as a QImage, reusing persistent GDI buffers on Windows"""
+        images = []
+        for screen, geom in screens:
+            image = None
+            capture = self._win_capture(screen, geom)
+            if capture is not None:
+                try:
+                    # A GDI grab shares the reusable DIB; the snapshot has to own its pixels.
+                    # Converting makes that copy and sets the alpha bytes BitBlt left at 0.
+                    image = capture.grab(geom.x(), geom.y()).convertToFormat(QImage.Format_RGB32)
+                except Exception as e:
+                    print(f"GDI capture failed, falling back to grabWindow: {e}")
+            if image is None:
+                # Screen pixels are opaque; RGB32 keeps every later blit off the alpha-blend path
+                image = screen.grabWindow(0).toImage().convertToFormat(QImage.Format_RGB32)
+            images.append(image)
+        return images
+
     def _create_overlays(self, width=800, height=600):
         try:
             # Clean up any existing overlays
@@ -504,27 +921,36 @@ class ScreenCaptureApp(QWidget):
             
             # Reset collections
             self.overlays = []
-            self.screenshots = {}
+            self.screen_images = []
+            self._last_selection_rect = QRect()
+            # The fixed-size preview follows the cursor from where it is now
+            self.cursor_pos = QCursor.pos()
+            
+            # Take all screenshots in one pass before any overlay exists, so no grab
+            # waits on (or captures) a half-shown overlay window. QScreen.grabWindow
+            # returns a QPixmap and has to stay on the GUI thread.
+            screens = self._screens()
+            for i, ((screen, geom), image) in enumerate(zip(screens, self._grab_screens(screens))):
+                if image is None or image.isNull():
+                    print(f"Warning: Invalid screenshot for screen {i}")
+                    image = None
+                self.screen_images.append((geom, image))
             
             # Create overlays for each screen
-            screens = QApplication.screens()
-            for i, screen in enumerate(screens):
-                # Create the overlay
-                overlay = OverlayWidget(self, screen, mode=self.capture_mode, fixed_width=width, fixed_height=height)
+            for i, ((screen, geom), (_, image)) in enumerate(zip(screens, self.screen_images)):
+                # Create the overlay showing its screen's snapshot
+                overlay = OverlayWidget(self, screen, mode=self.capture_mode, fixed_width=width, fixed_height=height,
+                                        background=image)
                 self.overlays.append(overlay)
                 
-                # Take screenshot
-                screen_pixmap = screen.grabWindow(0)
-                self.screenshots[i] = {
-                    'geometry': screen.geometry(),
-                    'pixmap': screen_pixmap
-                }
-                
-                # Show overlay after we've prepared its data
+                # Show overlay after we've prepared its data. Qt.Tool windows are shown
+                # without activation, so activate it to get Escape and the other keys.
                 overlay.show()
+                overlay.raise_()
+                overlay.activateWindow()
                 overlay.update()
                 
-                print(f"Overlay {i} created for capture at {screen.geometry().x()},{screen.geometry().y()} {screen.geometry().width()}x{screen.geometry().height()}")
+                logger.debug("Overlay %d created for capture at %d,%d %dx%d", i, geom.x(), geom.y(), geom.width(), geom.height())
                 
             self.is_capturing = True
             
@@ -537,136 +963,97 @@ class ScreenCaptureApp(QWidget):
             traceback.print_exc()
             self.show()
 
-    def update_all_overlays(self):
+    def update_all_overlays(self, selection_rect=None):
+        """Lets each overlay repaint what changed; given the new global selection rect, overlays
+        whose screen neither the previous nor the new selection touches are skipped"""
         try:
+            changed = None
+            if selection_rect is not None:
+                if selection_rect == self._last_selection_rect:
+                    # Nothing moved since the last update (e.g. a move event without a
+                    # pixel of cursor travel), so every overlay is already up to date
+                    return
+                if not self._last_selection_rect.isNull():
+                    changed = self._last_selection_rect.united(selection_rect)
+                self._last_selection_rect = QRect(selection_rect)
+            else:
+                # No selection now; the next one has to be drawn whatever it was before
+                self._last_selection_rect = QRect()
+            
             for overlay in self.overlays:
                 if overlay and overlay.isVisible():
-                    overlay.update()
+                    if changed is not None and not changed.intersects(overlay.screen_geometry):
+                        continue
+                    overlay.update_selection()
         except Exception as e:
             print(f"Error in update_all_overlays: {e}")
             traceback.print_exc()
 
+    def schedule_selection_update(self, overlay):
+        """Coalesces selection changes from mouse moves into one overlay update per frame"""
+        self._selection_update_source = overlay
+        if not self._selection_update_timer.isActive():
+            self._selection_update_timer.start()
+
+    def _flush_selection_update(self):
+        try:
+            overlay = self._selection_update_source
+            self._selection_update_source = None
+            if overlay is not None and self.is_capturing and overlay in self.overlays:
+                overlay.update_overlays()
+        except Exception as e:
+            print(f"Error in _flush_selection_update: {e}")
+            traceback.print_exc()
+
     def finish_capture(self):
         try:
-            print("Starting finish_capture")
+            logger.debug("Starting finish_capture")
             
-            # Store last capture coordinates - make explicit copies
-            if self.global_begin.isNull() or self.global_end.isNull():
-                print("Error: global_begin or global_end is null!")
+            # Make sure there is a selection to capture
+            if self.global_selection.isNull():
+                print("Error: global_selection is null!")
                 self.is_overlay_operation_in_progress = False
                 self._cleanup_overlays()
                 self.show()
                 return
                 
-            self.last_capture_begin = QPoint(self.global_begin)
-            self.last_capture_end = QPoint(self.global_end)
+            # The selection is kept normalized, so it already is the capture area
+            selection_rect = QRect(self.global_selection)
+            self.last_capture_rect = QRect(selection_rect)
+            x1, y1, width, height = selection_rect.getRect()
             
-            # Get normalized capture dimensions
-            x1 = min(self.global_begin.x(), self.global_end.x())
-            y1 = min(self.global_begin.y(), self.global_end.y())
-            x2 = max(self.global_begin.x(), self.global_end.x())
-            y2 = max(self.global_begin.y(), self.global_end.y())
-            
-            # Fix potential issues with global end coordinate
-            if self.global_end.y() < self.global_begin.y():
-                # Fix the common mistake in the original code where y2 used wrong coordinate
-                y2 = self.global_end.y()
-            
-            width = x2 - x1
-            height = y2 - y1
-            
-            print(f"Capturing from global: ({x1},{y1}) to ({x2},{y2}), size: {width}x{height}")
+            logger.debug("Capturing from global: (%d,%d) to (%d,%d), size: %dx%d", x1, y1, x1 + width, y1 + height, width, height)
             
             # Check if we have a valid selection
             if width > 10 and height > 10:
                 try:
-                    # Create pixmap for the selection
-                    selection = QPixmap(width, height)
-                    # Fill with transparent background first (in case portions are outside screens)
-                    selection.fill(Qt.transparent)
-                    
-                    painter = QPainter(selection)
-                    selection_rect = QRect(x1, y1, width, height)
-                    
-                    # Composite the relevant parts from each screen
-                    screen_count = len(self.screenshots)
-                    print(f"Compositing from {screen_count} screens")
-                    
-                    for i, screen_data in self.screenshots.items():
-                        try:
-                            geom = screen_data['geometry']
-                            pixmap = screen_data['pixmap']
-                            
-                            if not pixmap or pixmap.isNull():
-                                print(f"Warning: Invalid pixmap for screen {i}")
-                                continue
-                                
-                            # Calculate intersection with this screen
-                            overlap = selection_rect.intersected(geom)
-                            if not overlap.isEmpty():
-                                src_x = overlap.x() - geom.x()
-                                src_y = overlap.y() - geom.y()
-                                dst_x = overlap.x() - x1
-                                dst_y = overlap.y() - y1
-                                
-                                print(f"Screen {i}: Overlap at {overlap.x()},{overlap.y()} size {overlap.width()}x{overlap.height()}")
-                                print(f"  Source coords: {src_x},{src_y}")
-                                print(f"  Dest coords: {dst_x},{dst_y}")
-                                
-                                # Double-check valid source coordinates
-                                if (src_x >= 0 and src_y >= 0 and 
-                                    src_x + overlap.width() <= pixmap.width() and 
-                                    src_y + overlap.height() <= pixmap.height()):
-                                    painter.drawPixmap(dst_x, dst_y, pixmap, src_x, src_y, overlap.width(), overlap.height())
-                                else:
-                                    print(f"Warning: Source coordinates out of bounds for screen {i}")
-                        except Exception as e:
-                            print(f"Error compositing screen {i}: {e}")
-                            traceback.print_exc()
-                                
-                    painter.end()
-                    
-                    # Store a copy of the successful capture
-                    self.last_capture_pixmap = QPixmap(selection)
+                    # Cut the selection out of the snapshot of every screen it covers
+                    parts = []
+                    for geom, image in self.screen_images:
+                        overlap = selection_rect.intersected(geom)
+                        if image is None or overlap.isEmpty():
+                            continue
+                        source = _device_rect(overlap.translated(-geom.topLeft()), image.devicePixelRatio())
+                        parts.append((overlap, image.copy(source)))
+                    if not parts:
+                        print("Warning: No screen snapshot to capture from")
+                    selection = _join_capture(selection_rect, parts)
                     
                     # Process according to output mode
-                    if self.output_mode == "clipboard":
-                        image = selection.toImage()
-                        QApplication.clipboard().setImage(image)
-                        print("Image copied to clipboard")
-                    elif self.output_mode == "fixed_location":
-                        filename = f"capture_{x1}_{y1}_{width}x{height}.png"
-                        filepath = os.path.join(self.save_location, filename)
-                        counter = 1
-                        while os.path.exists(filepath):
-                            filename = f"capture_{x1}_{y1}_{width}x{height}_{counter}.png"
-                            filepath = os.path.join(self.save_location, filename)
-                            counter += 1
-                        success = selection.save(filepath, "PNG")
-                        print(f"Image saved to {filepath}: {success}")
-                    else:  # new_location
-                        filepath, _ = QFileDialog.getSaveFileName(
-                            self, 
-                            "Save Capture", 
-                            os.path.join(self.save_location, f"capture_{x1}_{y1}_{width}x{height}.png"), 
-                            "PNG Files (*.png)"
-                        )
-                        if filepath:
-                            success = selection.save(filepath, "PNG")
-                            print(f"Image saved to user-selected path: {success}")
+                    self._output_capture(selection, selection_rect)
                 except Exception as e:
                     print(f"Error processing capture: {e}")
                     traceback.print_exc()
             else:
-                print(f"Selection too small ({width}x{height}), not capturing")
+                logger.debug("Selection too small (%dx%d), not capturing", width, height)
             
             # Clean up overlays
             self._cleanup_overlays()
             
             # Reset state
             self.is_capturing = False
-            self.global_begin = QPoint()
-            self.global_end = QPoint()
+            self.global_selection = QRect()
+            self.drag_anchor = QPoint()
             
             # Enable toggle button since we now have a valid capture
             self.toggleFrameBtn.setEnabled(True)
@@ -675,12 +1062,12 @@ class ScreenCaptureApp(QWidget):
             self.is_overlay_operation_in_progress = False
             
             # Restore main window
-            print("Showing main window")
+            logger.debug("Showing main window")
             QApplication.processEvents()
             self.show()
             QApplication.processEvents()
             
-            print("Finish capture completed")
+            logger.debug("Finish capture completed")
             
         except Exception as e:
             self.is_overlay_operation_in_progress = False
@@ -688,10 +1075,14 @@ class ScreenCaptureApp(QWidget):
             traceback.print_exc()
             self.show()
 
+    def _on_mode_toggled(self, mode_id, checked):
+        if checked:
+            self.set_output_mode(self._MODE_BY_ID[mode_id])
+
     def set_output_mode(self, mode):
         try:
             self.output_mode = mode
-            print(f"Output mode set to: {mode}")
+            logger.debug("Output mode set to: %s", mode)
             self.setLocationButton.setEnabled(mode == "fixed_location")
             self.getLocationButton.setEnabled(mode == "fixed_location")
         except Exception as e:
@@ -702,93 +1093,88 @@ class ScreenCaptureApp(QWidget):
             folder = QFileDialog.getExistingDirectory(self, "Select Save Location", self.save_location)
             if folder:
                 self.save_location = folder
+                self._capture_names = None
                 self.locationLabel.setText(f"📁: {self.save_location}")
-                save_config(self.sizes, self.default_w, self.default_h, self.save_location)
+                self._config_save_timer.start()
                 print(f"Save location set to: {self.save_location}")
         except Exception as e:
             print(f"Error in set_save_location: {e}")
 
     def open_save_location(self):
         try:
-            if os.path.exists(self.save_location):
-                if sys.platform == "win32":
-                    os.startfile(self.save_location)
-                elif sys.platform == "darwin":  # macOS
-                    subprocess.run(["open", self.save_location])
-                else:  # Linux
-                    subprocess.run(["xdg-open", self.save_location])
-                print(f"Opened save location: {self.save_location}")
-            else:
+            # A single stat that fails loudly, rather than os.path.exists swallowing errors
+            try:
+                os.stat(self.save_location)
+            except FileNotFoundError:
                 print(f"Save location does not exist: {self.save_location}")
+                return
+            _OPEN_FOLDER(self.save_location)
+            print(f"Opened save location: {self.save_location}")
         except Exception as e:
             print(f"Error in open_save_location: {e}")
 
 class SimpleRectangleOverlay(QWidget):
     """A very simple overlay widget that just shows a blue rectangle."""
-    def __init__(self, parent, screen, begin_point, end_point):
+    # Painting resources shared by every frame, built once instead of per paintEvent
+    _DIM_FILL = QColor(0, 0, 0, 30)
+    _FRAME_PEN = QPen(QColor(0, 0, 255), 2, Qt.DashLine)
+    _TEXT_PEN = QPen(QColor(255, 255, 0))
+    _TEXT_BG_FILL = QColor(0, 0, 0, 180)
+
+    def __init__(self, parent, screen, capture_rect):
         super().__init__(None)  # Create without any initial flags
         
         self.parent = parent
         self.screen = screen
         self.screen_geom = screen.geometry()
-        self.begin_point = begin_point
-        self.end_point = end_point
+        self.capture_rect = QRect(capture_rect)
+        
+        # The outline never moves, so its local rect and size label are laid out once
+        self._rect = self.capture_rect.translated(-self.screen_geom.topLeft())
+        self._size_text = QStaticText(f"{self._rect.width()} × {self._rect.height()}")
+        self._size_text.setPerformanceHint(QStaticText.AggressiveCaching)
+        metrics = QFontMetrics(self.font())
+        text_x, text_y = _size_text_pos(self._rect, self.screen_geom.width(), self.screen_geom.height())
+        self._size_text_pos = QPoint(text_x, text_y - metrics.ascent())
+        self._text_rect = QRect(text_x - 2, text_y - 15,
+                                metrics.horizontalAdvance(self._size_text.text()) + 4, 20)
         
         # Set widget properties
         self.setGeometry(self.screen_geom)
         self.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_DeleteOnClose)
         
-        # Use ToolTip flag to hide from taskbar and remove window decorations
+        # Plain frameless tool window, hidden from the taskbar and without decorations.
+        # Qt.ToolTip is left out: window types aren't flags, and Qt.Tool | Qt.ToolTip
+        # is Qt.SplashScreen.
         self.setWindowFlags(Qt.FramelessWindowHint | 
                             Qt.WindowStaysOnTopHint | 
-                            Qt.Tool |  # Tool windows don't show in taskbar
-                            Qt.ToolTip)  # Hides form icon and won't steal focus
+                            Qt.Tool)  # Tool windows don't show in taskbar
         
     def paintEvent(self, event):
         """Just draw a blue rectangle and nothing else."""
         try:
             qp = QPainter(self)
+            # Only the exposed part needs repainting
+            dirty = event.rect()
+            qp.setClipRect(dirty)
             
-            # Convert global points to local for this screen
-            begin_local = self.begin_point - self.screen_geom.topLeft()
-            end_local = self.end_point - self.screen_geom.topLeft()
-            
-            # Create normalized rect (ensuring width/height are positive)
-            rect = QRect(
-                min(begin_local.x(), end_local.x()),
-                min(begin_local.y(), end_local.y()),
-                abs(end_local.x() - begin_local.x()),
-                abs(end_local.y() - begin_local.y())
-            )
+            rect = self._rect
             
             # Only draw if this rect intersects this overlay
             if rect.intersects(self.rect()):
                 # Semi-transparent background
-                qp.fillRect(self.rect(), QColor(0, 0, 0, 30))
+                qp.fillRect(dirty, self._DIM_FILL)
                 
                 # Blue dashed rectangle 
-                blue_pen = QPen(QColor(0, 0, 255), 2, Qt.DashLine)
-                qp.setPen(blue_pen)
+                qp.setPen(self._FRAME_PEN)
                 qp.drawRect(rect)
                 
-                # Size info
-                width, height = rect.width(), rect.height()
-                size_text = f"{width} × {height}"
-                qp.setPen(QColor(255, 255, 0))
-                
-                # Position text
-                text_x = rect.right() + 5 if rect.right() + 100 < self.width() else rect.left() - 100
-                text_y = rect.bottom() + 20 if rect.bottom() + 30 < self.height() else rect.top() - 10
-                
-                # Ensure text coordinates are valid
-                text_x = max(0, min(text_x, self.width() - 100))
-                text_y = max(15, min(text_y, self.height() - 5))
-                
-                # Draw text with background
-                text_rect = QRect(text_x - 2, text_y - 15, len(size_text) * 8 + 4, 20)
-                qp.fillRect(text_rect, QColor(0, 0, 0, 180))
-                qp.drawText(text_x, text_y, size_text)
+                # Size info, drawn with background
+                qp.setPen(self._TEXT_PEN)
+                qp.fillRect(self._text_rect, self._TEXT_BG_FILL)
+                qp.drawStaticText(self._size_text_pos, self._size_text)
                 
         except Exception as e:
             print(f"Error in SimpleRectangleOverlay.paintEvent: {e}")
@@ -800,7 +1186,14 @@ class SimpleRectangleOverlay(QWidget):
 
 
 class OverlayWidget(QWidget):
-    def __init__(self, parent, screen, mode="freehand", fixed_width=800, fixed_height=600):
+    # Painting resources shared by every frame, built once instead of per paintEvent
+    _NO_SCREENSHOT_FILL = QColor(0, 0, 0, 10)
+    _DIM_FILL = QColor(0, 0, 0, 30)
+    _FRAME_PEN = QPen(QColor(255, 0, 0), 2)
+    _TEXT_PEN = QPen(QColor(255, 255, 0))
+    _TEXT_BG_FILL = QColor(0, 0, 0, 180)
+
+    def __init__(self, parent, screen, mode="freehand", fixed_width=800, fixed_height=600, background=None):
         super().__init__(None)  # Create without any initial flags
         try:
             self.parent = parent
@@ -812,160 +1205,200 @@ class OverlayWidget(QWidget):
             self.handle_size = 10
             self.selected_handle = None
             
-            # Store an explicit reference to screen geometry
+            # Screenshot painted behind the selection; kept for the whole capture. A QImage
+            # is what the raster paint engine blits from natively.
+            self._bg_image = background
+            # Area covered by the selection frame and size label at the last update,
+            # so the next update only has to repaint what changed
+            self._last_rect = QRect()
+            # Unknown until the first update, which then repaints the whole overlay
+            self._dimmed = None
+            self._font_metrics = QFontMetrics(self.font())
+            # Laid-out size labels and their widths by (width, height); a drag keeps
+            # passing over the same sizes, so their glyphs are only shaped once
+            self._size_text_cache = {}
+            
+            # Store an explicit reference to screen geometry; the mouse and paint
+            # handlers use these instead of asking the QScreen every event
             self.screen_geometry = screen.geometry()
+            self._screen_topleft = self.screen_geometry.topLeft()
+            self._screen_x = self.screen_geometry.x()
+            self._screen_y = self.screen_geometry.y()
+            self._screen_width = self.screen_geometry.width()
+            self._screen_height = self.screen_geometry.height()
             geom = self.screen_geometry
             
             # Set this widget's geometry to match the screen
             self.setGeometry(geom)
-            print(f"Overlay widget geometry: {geom.x()},{geom.y()} {geom.width()}x{geom.height()}")
+            logger.debug("Overlay widget geometry: %d,%d %dx%d", geom.x(), geom.y(), geom.width(), geom.height())
             
             # Set basic properties
             self.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
             if mode in ["freehand", "fixed"]:
                 self.setCursor(Qt.CrossCursor)
             self.setMouseTracking(True)
-            self.setAttribute(Qt.WA_TranslucentBackground)
+            # Closing is the end of an overlay; let Qt free the window afterwards
+            self.setAttribute(Qt.WA_DeleteOnClose)
+            if background is not None and not background.isNull():
+                # The screenshot covers every pixel, so the overlay can be an opaque window
+                # instead of a layered one the compositor re-blends on every repaint
+                self.setAttribute(Qt.WA_OpaquePaintEvent)
+            else:
+                self.setAttribute(Qt.WA_TranslucentBackground)
             
             # Set window flags that prevent flickering and ensure it stays on top
             self.setWindowFlags(Qt.FramelessWindowHint | 
                                 Qt.WindowStaysOnTopHint | 
-                                Qt.Tool |  # Tool windows don't show in taskbar
-                                Qt.ToolTip |  # Hides form icon
+                                Qt.Tool |  # Tool windows don't show in taskbar and have no icon
                                 Qt.NoDropShadowWindowHint)  # Prevents shadow artifacts
 
-            # Add instructions label for active capture modes
+            # Instructions for active capture modes, painted from a cached pixmap instead
+            # of laying out a QLabel child on every overlay
+            self._instructions = None
             if mode in ["freehand", "fixed"]:
-                instruction_text = (
-                    "Click and drag to select an area, then release to capture" if mode == "freehand" 
-                    else f"Click to place a {fixed_width}×{fixed_height} capture area"
-                )
-                self.instructions = QLabel(instruction_text, self)
-                self.instructions.setAlignment(Qt.AlignCenter)
-                self.instructions.setStyleSheet(
-                    "background-color: rgba(0, 0, 0, 180); color: white; padding: 10px; border-radius: 5px; font-size: 14px;"
-                )
-                self.instructions.adjustSize()
-                self.instructions.move((geom.width() - self.instructions.width()) // 2, 20)
-
-            # For fixed size capture, we need to update the view frequently to show cursor position
-            if mode == "fixed":
-                self.update_timer = QTimer(self)
-                self.update_timer.timeout.connect(self.update)
-                self.update_timer.start(50)
-                
+                pixmap = _instruction_pixmap(mode, fixed_width, fixed_height, screen.devicePixelRatio())
+                size = pixmap.size() / pixmap.devicePixelRatio()
+                self._instructions = (QRect(QPoint((geom.width() - size.width()) // 2, 20), size), pixmap)
+
             # Make sure to call update after setup is complete
             self.update()
         except Exception as e:
             print(f"Error in OverlayWidget __init__: {e}")
             traceback.print_exc()
 
+    def _fixed_rect(self):
+        """Returns the fixed-size capture area centered on the cursor, in local coordinates"""
+        if not self.parent.is_capturing:
+            return None
+        # Where the last mouse move left the cursor; paints don't query the cursor
+        global_pos = self.parent.cursor_pos
+        fixed_width = self.fixed_width
+        fixed_height = self.fixed_height
+        
+        # Create a rect with the fixed dimensions centered on cursor
+        return QRect(
+            global_pos.x() - self._screen_x - fixed_width // 2, 
+            global_pos.y() - self._screen_y - fixed_height // 2, 
+            fixed_width, 
+            fixed_height
+        )
+
+    def _freehand_rect(self):
+        """Returns the freehand selection in local coordinates, or None if there is none"""
+        parent = self.parent
+        selection = parent.global_selection
+        if not parent.is_capturing or selection.isNull():
+            return None
+        # The selection is normalized, so its top-left is its smallest corner
+        if selection.x() < -10000 or selection.y() < -10000:
+            return None
+        # Convert the global selection to local for this screen
+        return selection.translated(-self._screen_topleft)
+
+    def _size_text(self, width, height):
+        """Returns the size label text as a cached QStaticText, and its width"""
+        key = (width, height)
+        cached = self._size_text_cache.get(key)
+        if cached is None:
+            if len(self._size_text_cache) >= 1024:
+                self._size_text_cache.clear()
+            size_text = f"{width} × {height}"
+            static_text = QStaticText(size_text)
+            static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+            cached = (static_text, self._font_metrics.horizontalAdvance(size_text))
+            self._size_text_cache[key] = cached
+        return cached
+
+    def _size_label(self, rect):
+        """Returns (size_text, text_x, text_y, background rect) for the size label of a selection;
+        size_text is a QStaticText and (text_x, text_y) the position of its baseline"""
+        size_text, text_width = self._size_text(rect.width(), rect.height())
+        text_x, text_y = _size_text_pos(rect, self._screen_width, self._screen_height)
+        text_rect = QRect(text_x - 2, text_y - 15, text_width + 4, 20)
+        return size_text, text_x, text_y, text_rect
+
+    def _selection_rect(self):
+        """Returns the selection for the current mode in local coordinates, or None"""
+        return self._fixed_rect() if self.mode == "fixed" else self._freehand_rect()
+
+    def release_background(self):
+        """Lets go of the screen snapshot now rather than whenever the Python wrapper is collected"""
+        self._bg_image = None
+
+    def update_overlays(self):
+        """Asks all overlays to show the current selection"""
+        rect = self._selection_rect()
+        self.parent.update_all_overlays(rect.translated(self._screen_topleft) if rect is not None else None)
+
+    def update_selection(self):
+        """Schedules a repaint of only the area the selection frame moved over"""
+        rect = self._selection_rect()
+        dimmed = rect is not None and rect.intersects(self.rect())
+        if dimmed:
+            extent = rect.adjusted(-2, -2, 3, 3).united(self._size_label(rect)[3])
+        else:
+            extent = QRect()
+        
+        if dimmed != self._dimmed:
+            # The whole screen gets (un)dimmed, so everything needs repainting
+            self._dimmed = dimmed
+            self.update()
+        else:
+            dirty = self._last_rect.united(extent)
+            if not dirty.isEmpty():
+                self.update(dirty)
+        self._last_rect = extent
+
+    def _draw_selection(self, qp, rect):
+        """Draws the red selection frame and its size label, the same for freehand and fixed mode"""
+        qp.setPen(self._FRAME_PEN)
+        qp.drawRect(rect)
+        
+        # Draw size info
+        size_text, text_x, text_y, text_rect = self._size_label(rect)
+        qp.setPen(self._TEXT_PEN)
+        
+        # Draw background for text
+        qp.fillRect(text_rect, self._TEXT_BG_FILL)
+        qp.drawStaticText(text_x, text_y - self._font_metrics.ascent(), size_text)
+
     def paintEvent(self, event):
         try:
             qp = QPainter(self)
-            qp.setClipRect(self.rect())
-            
-            screen_geom = self.screen.geometry()
+            dirty = event.rect()
+            qp.setClipRect(dirty)
+            # The frame and fills are axis-aligned, antialiasing them only costs time. Text
+            # antialiasing is a separate hint and stays on, so the size label stays readable.
+            qp.setRenderHint(QPainter.Antialiasing, False)
             
-            # Get screenshot for this screen - defensive lookups
-            screenshot_data = self.parent.screenshots.get(self.parent.overlays.index(self) if self in self.parent.overlays else -1, None)
-            screenshot = screenshot_data.get('pixmap', None) if screenshot_data else None
+            # Only handle active capture operations (fixed size or freehand)
+            # REMOVED the last frame overlay code since that's now handled by SimpleRectangleOverlay
+            rect = self._selection_rect() if self.mode in ["fixed", "freehand"] else None
+            # Only draw if this rect intersects this overlay
+            dimmed = rect is not None and rect.intersects(self.rect())
             
-            if screenshot and not screenshot.isNull():
-                qp.drawPixmap(0, 0, screenshot)
+            # Only blit the part of the screenshot that needs repainting
+            background = self._bg_image
+            if background is not None and not background.isNull():
+                ratio = background.devicePixelRatio()
+                source = QRectF(dirty.x() * ratio, dirty.y() * ratio, dirty.width() * ratio, dirty.height() * ratio)
+                qp.drawImage(QRectF(dirty), background, source)
             else:
                 # If no valid screenshot, draw a semi-transparent background as fallback
-                qp.fillRect(self.rect(), QColor(0, 0, 0, 10))
-
-            # Only handle active capture operations (fixed size or freehand)
-            # REMOVED the last frame overlay code since that's now handled by SimpleRectangleOverlay
+                qp.fillRect(dirty, self._NO_SCREENSHOT_FILL)
+            # The dim fill is clipped to the dirty rect like the blit, so it stays cheap
+            if dimmed:
+                qp.fillRect(dirty, self._DIM_FILL)
 
             # Red frame for active capture operations
-            if self.mode == "fixed" and self.parent.is_capturing:
-                global_pos = QCursor.pos()
-                local_x = global_pos.x() - screen_geom.x()
-                local_y = global_pos.y() - screen_geom.y()
-                
-                # Create a rect with the fixed dimensions centered on cursor
-                rect = QRect(
-                    local_x - self.fixed_width // 2, 
-                    local_y - self.fixed_height // 2, 
-                    self.fixed_width, 
-                    self.fixed_height
-                )
-
-                # Only draw if this rect intersects this overlay
-                if rect.intersects(self.rect()):
-                    # Draw semi-transparent overlay
-                    qp.fillRect(self.rect(), QColor(0, 0, 0, 30))
-                    
-                    # Draw red frame
-                    qp.setPen(QPen(QColor(255, 0, 0), 2))
-                    qp.drawRect(rect)
-                    
-                    # Draw size info
-                    width, height = rect.width(), rect.height()
-                    size_text = f"{width} × {height}"
-                    qp.setPen(QColor(255, 255, 0))
-                    
-                    # Position text in a visible area
-                    text_x = rect.right() + 5 if rect.right() + 100 < self.width() else rect.left() - 100
-                    text_y = rect.bottom() + 20 if rect.bottom() + 30 < self.height() else rect.top() - 10
-                    
-                    # Ensure text coordinates are valid
-                    text_x = max(0, min(text_x, self.width() - 100))
-                    text_y = max(15, min(text_y, self.height() - 5))
-                    
-                    # Draw background for text
-                    text_rect = QRect(text_x - 2, text_y - 15, len(size_text) * 8 + 4, 20)
-                    qp.fillRect(text_rect, QColor(0, 0, 0, 180))
-                    qp.drawText(text_x, text_y, size_text)
-
-            elif self.mode == "freehand" and self.parent.is_capturing and not self.parent.global_begin.isNull() and not self.parent.global_end.isNull():
-                # Check if both points are valid
-                if self.parent.global_begin.x() < -10000 or self.parent.global_begin.y() < -10000 or \
-                self.parent.global_end.x() < -10000 or self.parent.global_end.y() < -10000:
-                    print("Invalid coordinates for freehand selection")
-                    return
-                    
-                # Convert global points to local for this screen
-                begin_local = self.parent.global_begin - screen_geom.topLeft()
-                end_local = self.parent.global_end - screen_geom.topLeft()
-                
-                # Create normalized rect
-                rect = QRect(
-                    min(begin_local.x(), end_local.x()),
-                    min(begin_local.y(), end_local.y()),
-                    abs(end_local.x() - begin_local.x()),
-                    abs(end_local.y() - begin_local.y())
-                )
-
-                # Only draw if this rect intersects this overlay
-                if rect.intersects(self.rect()):
-                    # Draw semi-transparent overlay
-                    qp.fillRect(self.rect(), QColor(0, 0, 0, 30))
-                    
-                    # Draw red frame
-                    qp.setPen(QPen(QColor(255, 0, 0), 2))
-                    qp.drawRect(rect)
-                    
-                    # Draw size info
-                    width, height = rect.width(), rect.height()
-                    size_text = f"{width} × {height}"
-                    qp.setPen(QColor(255, 255, 0))
-                    
-                    # Position text in a visible area
-                    text_x = rect.right() + 5 if rect.right() + 100 < self.width() else rect.left() - 100
-                    text_y = rect.bottom() + 20 if rect.bottom() + 30 < self.height() else rect.top() - 10
-                    
-                    # Ensure text coordinates are valid
-                    text_x = max(0, min(text_x, self.width() - 100))
-                    text_y = max(15, min(text_y, self.height() - 5))
-                    
-                    # Draw background for text
-                    text_rect = QRect(text_x - 2, text_y - 15, len(size_text) * 8 + 4, 20)
-                    qp.fillRect(text_rect, QColor(0, 0, 0, 180))
-                    qp.drawText(text_x, text_y, size_text)
+            if dimmed:
+                self._draw_selection(qp, rect)
+
+            # Instructions stay on top of the selection, like the label they replace
+            if self._instructions is not None:
+                instructions_rect, pixmap = self._instructions
+                if instructions_rect.intersects(dirty):
+                    qp.drawPixmap(instructions_rect.topLeft(), pixmap)
 
         except Exception as e:
             print(f"Error in paintEvent: {e}")
@@ -974,20 +1407,16 @@ class OverlayWidget(QWidget):
     def mousePressEvent(self, event):
         try:
             if event.button() == Qt.LeftButton and self.parent.is_capturing:
-                global_pos = QCursor.pos()
-                screen_geom = self.screen.geometry()
-                local_pos = global_pos - screen_geom.topLeft()
-                print(f"Mouse press in mode: {self.mode} at global: {global_pos.x()},{global_pos.y()}")
+                global_pos = event.globalPos()
+                screen_geom = self.screen_geometry
+                logger.debug("Mouse press in mode: %s at global: %d,%d", self.mode, global_pos.x(), global_pos.y())
 
                 if self.mode == "fixed":
-                    # Stop the update timer if it exists
-                    if hasattr(self, 'update_timer') and self.update_timer.isActive():
-                        self.update_timer.stop()
-                        
                     # Calculate position
                     local_x = global_pos.x() - screen_geom.x()
                     local_y = global_pos.y() - screen_geom.y()
-                    print(f"Fixed mode click at global: {global_pos.x()},{global_pos.y()} local: {local_x},{local_y} on screen {screen_geom.x()},{screen_geom.y()}")
+                    logger.debug("Fixed mode click at global: %d,%d local: %d,%d on screen %d,%d",
+                                 global_pos.x(), global_pos.y(), local_x, local_y, screen_geom.x(), screen_geom.y())
                     
                     # Create rect centered on click position
                     rect = QRect(
@@ -998,43 +1427,46 @@ class OverlayWidget(QWidget):
                     )
                     
                     # Convert to global coordinates
-                    self.parent.global_begin = rect.topLeft() + screen_geom.topLeft()
-                    self.parent.global_end = rect.bottomRight() + screen_geom.topLeft()
+                    self.parent.global_selection = rect.translated(self._screen_topleft)
                     
                     # Finish capture
                     self.parent.finish_capture()
                     
                 elif self.mode == "freehand" and screen_geom.contains(global_pos):
                     # Start drag operation
-                    self.parent.global_begin = global_pos
-                    self.parent.global_end = global_pos
+                    self.parent.drag_anchor = global_pos
+                    self.parent.global_selection = _span_rect(global_pos, global_pos)
                     self.is_drawing = True
-                    print(f"Freehand start at global: {global_pos.x()},{global_pos.y()} on screen {screen_geom.x()},{screen_geom.y()}")
-                    self.parent.update_all_overlays()
+                    logger.debug("Freehand start at global: %d,%d on screen %d,%d",
+                                 global_pos.x(), global_pos.y(), screen_geom.x(), screen_geom.y())
+                    self.update_overlays()
         except Exception as e:
             print(f"Error in mousePressEvent: {e}")
             traceback.print_exc()
 
     def mouseMoveEvent(self, event):
         try:
-            if self.parent.is_capturing:
-                global_pos = QCursor.pos()
-                screen_geom = self.screen.geometry()
+            parent = self.parent
+            if parent.is_capturing:
+                global_pos = event.globalPos()  # Carried by the event, no cursor query needed
                 
                 # Check for valid cursor position
                 if global_pos.x() < -10000 or global_pos.y() < -10000:
                     return
                     
-                local_pos = global_pos - screen_geom.topLeft()
-
-                if self.mode == "freehand" and self.is_drawing:
-                    # Update end position and redraw all overlays
-                    self.parent.global_end = global_pos
-                    print(f"Freehand move to global: {self.parent.global_end.x()},{self.parent.global_end.y()} on screen {self.screen.geometry().x()},{self.screen.geometry().y()}")
-                    self.parent.update_all_overlays()
-                elif self.mode == "fixed":
-                    # Just update this overlay to show preview rectangle
-                    self.update()
+                parent.cursor_pos = global_pos
+                mode = self.mode
+                if mode == "freehand" and self.is_drawing:
+                    # Update end position; the overlays redraw on the next frame
+                    parent.global_selection = _span_rect(parent.drag_anchor, global_pos)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Freehand move to global: %d,%d on screen %d,%d",
+                                     global_pos.x(), global_pos.y(), self.screen_geometry.x(), self.screen_geometry.y())
+                    parent.schedule_selection_update(self)
+                elif mode == "fixed":
+                    # Move the preview rectangle; it may straddle screens, so every overlay
+                    # it touches repaints whatever part of it changed
+                    parent.schedule_selection_update(self)
         except Exception as e:
             print(f"Error in mouseMoveEvent: {e}")
             traceback.print_exc()
@@ -1042,24 +1474,25 @@ class OverlayWidget(QWidget):
     def mouseReleaseEvent(self, event):
         try:
             if event.button() == Qt.LeftButton and self.parent.is_capturing:
-                global_pos = QCursor.pos()
+                global_pos = event.globalPos()
                 
                 # Check for valid cursor position
                 if global_pos.x() < -10000 or global_pos.y() < -10000:
-                    print("Invalid cursor position in mouseReleaseEvent")
+                    logger.debug("Invalid cursor position in mouseReleaseEvent")
                     return
                     
                 if self.mode == "freehand" and self.is_drawing:
                     self.is_drawing = False
-                    self.parent.global_end = global_pos
-                    print(f"Freehand release at global: {self.parent.global_end.x()},{self.parent.global_end.y()} on screen {self.screen.geometry().x()},{self.screen.geometry().y()}")
+                    self.parent.global_selection = _span_rect(self.parent.drag_anchor, global_pos)
+                    logger.debug("Freehand release at global: %d,%d on screen %d,%d",
+                                 global_pos.x(), global_pos.y(), self.screen_geometry.x(), self.screen_geometry.y())
                     
                     # Check if we have a minimum size selection
-                    width = abs(self.parent.global_end.x() - self.parent.global_begin.x())
-                    height = abs(self.parent.global_end.y() - self.parent.global_begin.y())
+                    width = self.parent.global_selection.width()
+                    height = self.parent.global_selection.height()
                     
                     if width < 10 or height < 10:
-                        print(f"Selection too small ({width}x{height}), aborting capture")
+                        logger.debug("Selection too small (%dx%d), aborting capture", width, height)
                         self.parent.is_overlay_operation_in_progress = False
                         self.parent._cleanup_overlays()
                         self.parent.show()
@@ -1075,10 +1508,6 @@ class OverlayWidget(QWidget):
     def keyPressEvent(self, event):
         try:
             if event.key() == Qt.Key_Escape and self.parent.is_capturing:
-                # Stop any active timers
-                if hasattr(self, 'update_timer') and self.update_timer.isActive():
-                    self.update_timer.stop()
-                    
                 # Clean up and abort
                 self.parent._cleanup_overlays()
                 self.parent.is_capturing = False
@@ -1092,6 +1521,7 @@ class OverlayWidget(QWidget):
 
 def main():
     try:
+        logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
         app = QApplication(sys.argv)